@@ -1,9 +1,7 @@
 import streamlit as st
 import json
-import pypdf
-import pdfplumber
-from pptx import Presentation
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from groq import Groq
 from dotenv import load_dotenv
 import tempfile
@@ -12,103 +10,89 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
+from extraction import (
+    extract_text_from_pdf,
+    extract_text_from_pdf_pages,
+    extract_text_from_pptx,
+    run_sandboxed_extraction,
+    extract_submission_text
+)
 
 # Load environment variables
 load_dotenv()
 
+# Background PDF report rendering threads (process-wide)
+REPORT_RENDER_WORKERS = int(os.getenv("REPORT_RENDER_WORKERS", "32"))
+# How long a run waits for its report before offering a status check instead
+REPORT_WAIT_SECONDS = float(os.getenv("REPORT_WAIT_SECONDS", "5"))
+
 # Initialize Groq client
 def get_groq_client():
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         st.error("Please set your GROQ_API_KEY in the environment variables or .env file")
         st.stop()
-    return Groq(api_key=api_key)
+    return Groq(api_key=api_key, max_retries=int(os.getenv("GROQ_MAX_RETRIES", "2")))
+
+def request_completion(client, prompt, max_tokens):
+    """Single chat completion call; returns the stripped response text"""
+    response = client.chat.completions.create(
+        model="llama3-8b-8192",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.3,
+        max_tokens=max_tokens
+    )
+    return response.choices[0].message.content.strip()
 
-def extract_text_from_pdf(file_path):
-    """Enhanced PDF text extraction using multiple methods for better coverage"""
-    text = ""
+def extract_json_text(result_text):
+    """Enhanced JSON extraction with multiple fallback methods"""
+    json_text = result_text
     
-    # Method 1: Try pdfplumber first (better for complex layouts)
-    try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                
-                # Also extract text from tables if any
-                tables = page.extract_tables()
-                for table in tables:
-                    for row in table:
-                        if row:
-                            text += " | ".join([cell or "" for cell in row]) + "\n"
-        
-        if text.strip():
-            return text
-    except Exception as e:
-        st.warning(f"pdfplumber extraction failed: {str(e)}, trying pypdf...")
+    # Method 1: Extract from ```json blocks
+    if "```json" in result_text:
+        json_text = result_text.split("```json")[1].split("```")[0].strip()
+    # Method 2: Extract from ``` blocks
+    elif "```" in result_text:
+        json_text = result_text.split("```")[1].strip()
+    # Method 3: Look for JSON-like structure
+    elif "{" in result_text and "}" in result_text:
+        start = result_text.find("{")
+        end = result_text.rfind("}") + 1
+        json_text = result_text[start:end]
     
-    # Method 2: Fallback to pypdf if pdfplumber fails
-    try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = pypdf.PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        if text.strip():
-            return text
-    except Exception as e:
-        st.error(f"Error extracting text from PDF with both methods: {str(e)}")
-        return None
-    
-    return text if text.strip() else None
+    # Clean up common issues
+    return json_text.strip()
 
-def extract_text_from_pptx(file_path):
-    """Enhanced PPTX text extraction including slide notes and comprehensive content"""
-    try:
-        prs = Presentation(file_path)
-        text = ""
-        
-        for slide_num, slide in enumerate(prs.slides, 1):
-            text += f"\n--- Slide {slide_num} ---\n"
-            
-            # Extract text from all shapes
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text += shape.text + "\n"
-                
-                # Extract text from tables
-                if shape.has_table:
-                    table = shape.table
-                    for row in table.rows:
-                        row_text = []
-                        for cell in row.cells:
-                            if cell.text.strip():
-                                row_text.append(cell.text.strip())
-                        if row_text:
-                            text += " | ".join(row_text) + "\n"
-                
-                # Extract text from text frames and paragraphs
-                if hasattr(shape, "text_frame"):
-                    for paragraph in shape.text_frame.paragraphs:
-                        if paragraph.text.strip():
-                            text += paragraph.text + "\n"
-            
-            # Extract slide notes if available
-            if slide.has_notes_slide:
-                notes_slide = slide.notes_slide
-                if hasattr(notes_slide, 'notes_text_frame'):
-                    notes_text = notes_slide.notes_text_frame.text
-                    if notes_text.strip():
-                        text += f"[Slide Notes: {notes_text}]\n"
-        
-        return text.strip() if text.strip() else None
-        
-    except Exception as e:
-        st.error(f"Error extracting text from PPTX: {str(e)}")
-        return None
+def build_evaluation_result(parsed_result):
+    """Validate required fields and provide defaults if missing"""
+    return {
+        "scores": {
+            "clarity": parsed_result.get("scores", {}).get("clarity", 5),
+            "innovation": parsed_result.get("scores", {}).get("innovation", 5),
+            "feasibility": parsed_result.get("scores", {}).get("feasibility", 5),
+            "presentation": parsed_result.get("scores", {}).get("presentation", 5),
+            "impact": parsed_result.get("scores", {}).get("impact", 5),
+            "theme_alignment": parsed_result.get("scores", {}).get("theme_alignment", 5)
+        },
+        "total_score": parsed_result.get("total_score", 30),
+        "grade": parsed_result.get("grade", "B"),
+        "feedback_summary": parsed_result.get("feedback_summary", "Evaluation completed successfully."),
+        "theme": parsed_result.get("theme", "General"),
+        "keywords": parsed_result.get("keywords", ["innovation", "technology", "solution"]),
+        "project_title": parsed_result.get("project_title", "Innovative Solution"),
+        "project_summary": parsed_result.get("project_summary", "A comprehensive solution addressing key challenges."),
+        "improvement_suggestions": parsed_result.get("improvement_suggestions", [
+            "Enhance clarity in presentation",
+            "Provide more detailed implementation plan",
+            "Include market analysis and validation"
+        ]),
+        "recommended_resources": parsed_result.get("recommended_resources", [
+            "Business Model Canvas",
+            "Lean Startup Methodology"
+        ]),
+        "visual_quality_comment": parsed_result.get("visual_quality_comment", "Content appears well-structured."),
+        "pitch_readiness_score": parsed_result.get("pitch_readiness_score", 6)
+    }
 
 def evaluate_submission(extracted_text):
     """Enhanced evaluation with advanced features using Groq API"""
@@ -168,73 +152,19 @@ def evaluate_submission(extracted_text):
 }}"""
 
     try:
-        response = client.chat.completions.create(
-            model="llama3-8b-8192",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=1500  # Increased token limit for comprehensive response
-        )
-        
-        result_text = response.choices[0].message.content.strip()
+        result_text = request_completion(client, prompt, max_tokens=1500)  # Increased token limit for comprehensive response
         
         # Debug: Show raw response in expander for troubleshooting
         with st.expander("🔧 Debug: Raw AI Response", expanded=False):
             st.text_area("Raw Response", result_text, height=200)
         
-        # Enhanced JSON extraction with multiple fallback methods
-        json_text = result_text
-        
-        # Method 1: Extract from ```json blocks
-        if "```json" in result_text:
-            json_text = result_text.split("```json")[1].split("```")[0].strip()
-        # Method 2: Extract from ``` blocks
-        elif "```" in result_text:
-            json_text = result_text.split("```")[1].strip()
-        # Method 3: Look for JSON-like structure
-        elif "{" in result_text and "}" in result_text:
-            start = result_text.find("{")
-            end = result_text.rfind("}") + 1
-            json_text = result_text[start:end]
-        
-        # Clean up common issues
-        json_text = json_text.strip()
+        json_text = extract_json_text(result_text)
         
         # Try to parse JSON
         if json_text:
             try:
                 parsed_result = json.loads(json_text)
-                
-                # Validate required fields and provide defaults if missing
-                default_result = {
-                    "scores": {
-                        "clarity": parsed_result.get("scores", {}).get("clarity", 5),
-                        "innovation": parsed_result.get("scores", {}).get("innovation", 5),
-                        "feasibility": parsed_result.get("scores", {}).get("feasibility", 5),
-                        "presentation": parsed_result.get("scores", {}).get("presentation", 5),
-                        "impact": parsed_result.get("scores", {}).get("impact", 5),
-                        "theme_alignment": parsed_result.get("scores", {}).get("theme_alignment", 5)
-                    },
-                    "total_score": parsed_result.get("total_score", 30),
-                    "grade": parsed_result.get("grade", "B"),
-                    "feedback_summary": parsed_result.get("feedback_summary", "Evaluation completed successfully."),
-                    "theme": parsed_result.get("theme", "General"),
-                    "keywords": parsed_result.get("keywords", ["innovation", "technology", "solution"]),
-                    "project_title": parsed_result.get("project_title", "Innovative Solution"),
-                    "project_summary": parsed_result.get("project_summary", "A comprehensive solution addressing key challenges."),
-                    "improvement_suggestions": parsed_result.get("improvement_suggestions", [
-                        "Enhance clarity in presentation",
-                        "Provide more detailed implementation plan",
-                        "Include market analysis and validation"
-                    ]),
-                    "recommended_resources": parsed_result.get("recommended_resources", [
-                        "Business Model Canvas",
-                        "Lean Startup Methodology"
-                    ]),
-                    "visual_quality_comment": parsed_result.get("visual_quality_comment", "Content appears well-structured."),
-                    "pitch_readiness_score": parsed_result.get("pitch_readiness_score", 6)
-                }
-                
-                return default_result
+                return build_evaluation_result(parsed_result)
                 
             except json.JSONDecodeError as json_error:
                 st.error(f"JSON parsing failed: {str(json_error)}")
@@ -248,6 +178,131 @@ def evaluate_submission(extracted_text):
         st.error(f"Error calling Groq API: {str(e)}")
         return None
 
+# Fields owned by the short scoring sub-request; everything else comes from the insights sub-request
+SCORE_FIELDS = ("scores", "total_score", "grade", "pitch_readiness_score")
+
+def evaluate_submission_parallel(extracted_text, on_scores=None):
+    """Decomposed evaluation: scores and narrative insights as concurrent, smaller sub-requests.
+    
+    Returns the same result dict as evaluate_submission. `on_scores` is called from the
+    calling (script) thread with a partial result as soon as the short scoring call returns,
+    so wall-clock latency is bounded by the longest sub-request rather than the sum.
+    """
+    client = get_groq_client()
+    
+    scores_prompt = f"""You are an expert AI evaluator for pitch decks, MSME proposals, and hackathon submissions. Score the submission below.
+
+🎯 Evaluation Criteria (Each scored from 1 to 10):
+1. **Clarity** – Is the idea, problem, and solution clearly explained?
+2. **Innovation** – How novel, original, or disruptive is the idea?
+3. **Feasibility** – Is the solution technically and practically implementable?
+4. **Presentation Quality** – Is the content professional, structured, and engaging?
+5. **Impact** – What is the expected market, economic, or social impact?
+6. **Theme Alignment** – How well does it align with competition goals or MSME objectives?
+Also give a **Pitch Readiness Score** (Out of 10 – readiness for investors/juries).
+
+📄 Submission Content:
+\"\"\"{extracted_text}\"\"\"
+
+✅ Output Format (Return ONLY compact valid JSON, no explanations):
+{{"scores": {{"clarity": 0, "innovation": 0, "feasibility": 0, "presentation": 0, "impact": 0, "theme_alignment": 0}}, "total_score": 0, "grade": "A+", "pitch_readiness_score": 0}}"""
+
+    insights_prompt = f"""You are an expert AI evaluator for pitch decks, MSME proposals, and hackathon submissions. Analyze the extracted content and provide qualitative insights (no numeric scores).
+
+🔍 Advanced Analysis Required:
+1. **Professional Feedback** (3-line summary of strengths and areas for improvement)
+2. **Detected Theme/Domain** (e.g., FinTech, HealthTech, Sustainability, EdTech, AgriTech)
+3. **Top Keywords** (5-10 core concepts or buzzwords from the content)
+4. **Suggested Project Title** (Max 10 words, catchy and relevant)
+5. **2-Line Summary** (Concise description of the idea)
+6. **Improvement Suggestions** (3 concrete actionable points)
+7. **Recommended Resources** (2 relevant tools, frameworks, or platforms)
+8. **Visual Quality Check** (Assess design/structure quality from textual cues)
+
+📄 Submission Content:
+\"\"\"{extracted_text}\"\"\"
+
+✅ Output Format (Return ONLY valid JSON):
+{{
+    "feedback_summary": "Professional 3-line summary of the submission's strengths and areas for improvement.",
+    "theme": "Primary domain/industry category",
+    "keywords": ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"],
+    "project_title": "Catchy Project Title (Max 10 Words)",
+    "project_summary": "Two-line concise description of the core idea and its value proposition.",
+    "improvement_suggestions": [
+        "Specific actionable improvement 1",
+        "Specific actionable improvement 2",
+        "Specific actionable improvement 3"
+    ],
+    "recommended_resources": [
+        "Relevant tool/framework/platform 1",
+        "Relevant tool/framework/platform 2"
+    ],
+    "visual_quality_comment": "Assessment of presentation design and structure quality based on content organization"
+}}"""
+
+    sub_requests = {
+        "scores": (scores_prompt, 150),
+        "insights": (insights_prompt, 1000)
+    }
+    
+    executor = ThreadPoolExecutor(max_workers=len(sub_requests), thread_name_prefix="evaluation")
+    futures = {
+        executor.submit(request_completion, client, prompt, max_tokens): name
+        for name, (prompt, max_tokens) in sub_requests.items()
+    }
+    merged_result = {}
+    raw_responses = {}
+    scores_shown = False
+    errors = []
+    
+    try:
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                raw_responses[name] = future.result()
+            except Exception as e:
+                errors.append(f"Error calling Groq API ({name} request): {str(e)}")
+                break
+            
+            json_text = extract_json_text(raw_responses[name])
+            if not json_text:
+                errors.append(f"No valid JSON content found in AI response ({name} request)")
+                break
+            try:
+                parsed_result = json.loads(json_text)
+            except json.JSONDecodeError as json_error:
+                errors.append(f"JSON parsing failed ({name} request): {str(json_error)}")
+                errors.append(f"Attempted to parse: {json_text[:200]}...")
+                break
+            
+            # Keep only the fields this sub-request owns so the two responses never clobber each other
+            merged_result.update({
+                key: value for key, value in parsed_result.items()
+                if (key in SCORE_FIELDS) == (name == "scores")
+            })
+            
+            if name == "scores" and on_scores:
+                on_scores(build_evaluation_result(merged_result))
+                scores_shown = True
+    finally:
+        # Don't block on a sibling sub-request after a failure
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # Debug: Show raw responses in expander for troubleshooting, including any that failed to parse
+    with st.expander("🔧 Debug: Raw AI Response", expanded=False):
+        for name, result_text in raw_responses.items():
+            st.text_area(f"Raw Response ({name})", result_text, height=200)
+    
+    if errors:
+        for error in errors:
+            st.error(error)
+        if scores_shown:
+            st.warning("⚠️ The scores above arrived, but the detailed insights did not, so this evaluation is incomplete and was not saved. Click Evaluate Submission to try again.")
+        return None
+    
+    return build_evaluation_result(merged_result)
+
 def generate_pdf_report(evaluation_result, filename):
     """Generate comprehensive PDF report with advanced analysis"""
     buffer = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
@@ -351,6 +406,107 @@ def generate_pdf_report(evaluation_result, filename):
     os.unlink(buffer.name)
     return pdf_data
 
+@st.cache_resource
+def get_report_executor():
+    """Process-wide pool for speculative PDF report rendering, shared across sessions and reruns.
+    
+    Sized for concurrent judges (threads are only created on demand) so one session's
+    report never queues behind another's.
+    """
+    return ThreadPoolExecutor(max_workers=REPORT_RENDER_WORKERS, thread_name_prefix="report")
+
+def start_report_rendering(evaluation_result, filename):
+    """Kick off generate_pdf_report in the background as soon as an evaluation lands"""
+    st.session_state.report_future = get_report_executor().submit(generate_pdf_report, evaluation_result, filename)
+
+def display_evaluation_results(evaluation_result):
+    """Render the evaluation dashboard for a stored result"""
+    # Advanced Analysis Section
+    st.header("🔍 Advanced Analysis")
+    
+    # Top row - Key insights
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🎯 Theme/Domain", evaluation_result.get('theme', 'Not detected'))
+    with col2:
+        st.metric("🎯 Total Score", f"{evaluation_result['total_score']}/60")
+    with col3:
+        st.metric("🚀 Pitch Readiness", f"{evaluation_result.get('pitch_readiness_score', 0)}/10")
+    
+    # Project insights
+    st.subheader("💡 Project Insights")
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.write("**🏷️ Suggested Project Title:**")
+        st.info(evaluation_result.get('project_title', 'Title not generated'))
+        
+        st.write("**📝 Project Summary:**")
+        st.write(evaluation_result.get('project_summary', 'Summary not available'))
+    
+    with col2:
+        st.write("**🔑 Top Keywords:**")
+        keywords = evaluation_result.get('keywords', [])
+        if keywords:
+            # Display keywords as tags
+            keyword_html = " ".join([f"<span style='background-color: #e1f5fe; padding: 2px 8px; border-radius: 12px; margin: 2px; display: inline-block;'>{kw}</span>" for kw in keywords])
+            st.markdown(keyword_html, unsafe_allow_html=True)
+        else:
+            st.write("No keywords detected")
+    
+    # Scores section
+    st.header("📊 Detailed Evaluation Scores")
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Scores table
+        scores_data = {
+            "Criteria": ["Clarity", "Innovation", "Feasibility", "Presentation Quality", "Impact", "Theme Alignment"],
+            "Score (out of 10)": [
+                evaluation_result['scores']['clarity'],
+                evaluation_result['scores']['innovation'],
+                evaluation_result['scores']['feasibility'],
+                evaluation_result['scores']['presentation'],
+                evaluation_result['scores']['impact'],
+                evaluation_result['scores']['theme_alignment']
+            ]
+        }
+        
+        st.dataframe(scores_data, use_container_width=True)
+    
+    with col2:
+        # Grade with color coding
+        grade = evaluation_result['grade']
+        if grade in ['A+', 'A']:
+            st.success(f"🏅 Grade: {grade}")
+        elif grade == 'B':
+            st.warning(f"🏅 Grade: {grade}")
+        else:
+            st.error(f"🏅 Grade: {grade}")
+        
+        # Visual quality assessment
+        st.write("**🎨 Visual Quality:**")
+        visual_comment = evaluation_result.get('visual_quality_comment', 'Not assessed')
+        st.write(visual_comment)
+    
+    # Feedback and suggestions
+    st.header("💬 Professional Feedback")
+    st.info(evaluation_result['feedback_summary'])
+    
+    # Improvement suggestions and resources
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🛠 Improvement Suggestions")
+        for i, suggestion in enumerate(evaluation_result['improvement_suggestions'], 1):
+            st.write(f"{i}. {suggestion}")
+    
+    with col2:
+        st.subheader("📚 Recommended Resources")
+        resources = evaluation_result.get('recommended_resources', [])
+        for i, resource in enumerate(resources, 1):
+            st.write(f"{i}. {resource}")
+
 def main():
     st.set_page_config(
         page_title="📝 Submission Evaluator",
@@ -371,6 +527,12 @@ def main():
         )
         if groq_api_key:
             os.environ["GROQ_API_KEY"] = groq_api_key
+        parallel_evaluation = st.checkbox(
+            "⚡ Parallel evaluation",
+            value=False,
+            help="Request scores and insights as concurrent, smaller AI calls. Scores appear as soon as they are ready, "
+                 "but the submission is sent twice, roughly doubling input-token usage."
+        )
     
     # File upload section
     st.header("📤 Upload Your Submission")
@@ -381,164 +543,129 @@ def main():
     )
     
     if uploaded_file is not None:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
+        # Extract once per upload; reruns (button clicks, downloads) reuse the session copy
+        if st.session_state.get("upload_id") != uploaded_file.file_id:
+            if not uploaded_file.name.lower().endswith(('.pdf', '.pptx')):
+                st.error("Unsupported file type")
+                return
+            
+            # Save uploaded file temporarily
+            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
+                tmp_file.write(uploaded_file.getvalue())
+                tmp_file_path = tmp_file.name
+            
+            try:
+                with st.spinner("🔍 Extracting content from your submission..."):
+                    extracted_text, extraction_issues = extract_submission_text(tmp_file_path, uploaded_file.name)
+            finally:
+                # Clean up temporary file
+                if os.path.exists(tmp_file_path):
+                    os.unlink(tmp_file_path)
+            
+            st.session_state.upload_id = uploaded_file.file_id
+            st.session_state.extracted_text = extracted_text
+            st.session_state.extraction_issues = extraction_issues
+            st.session_state.evaluation_result = None
+            st.session_state.report_future = None
+        
+        extracted_text = st.session_state.extracted_text
+        extraction_issues = st.session_state.extraction_issues
+        
+        if extracted_text:
+            for issue in extraction_issues:
+                st.warning(f"⚠️ {issue}")
+        else:
+            st.error(f"❌ Could not extract content: {'; '.join(extraction_issues)}")
         
-        try:
-            # Extract text based on file type
-            with st.spinner("🔍 Extracting content from your submission..."):
-                if uploaded_file.name.lower().endswith('.pdf'):
-                    extracted_text = extract_text_from_pdf(tmp_file_path)
-                elif uploaded_file.name.lower().endswith('.pptx'):
-                    extracted_text = extract_text_from_pptx(tmp_file_path)
+        if extracted_text:
+            # Show extraction statistics
+            word_count = len(extracted_text.split())
+            char_count = len(extracted_text)
+            line_count = len(extracted_text.split('\n'))
+            
+            st.success("✅ Content extracted successfully!")
+            
+            # Display extraction stats
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("📝 Words", f"{word_count:,}")
+            with col2:
+                st.metric("🔤 Characters", f"{char_count:,}")
+            with col3:
+                st.metric("📄 Lines", f"{line_count:,}")
+            
+            # Show extracted text preview with better formatting
+            with st.expander("📄 Preview Extracted Content", expanded=False):
+                if len(extracted_text) > 2000:
+                    st.info(f"Showing first 2000 characters of {len(extracted_text):,} total characters")
+                    preview_text = extracted_text[:2000] + "\n\n... [Content truncated for preview] ..."
                 else:
-                    st.error("Unsupported file type")
-                    return
+                    preview_text = extracted_text
+                
+                st.text_area(
+                    "Extracted Text", 
+                    preview_text, 
+                    height=300,
+                    help="This is the text content that will be sent to AI for evaluation"
+                )
             
-            if extracted_text:
-                # Show extraction statistics
-                word_count = len(extracted_text.split())
-                char_count = len(extracted_text)
-                line_count = len(extracted_text.split('\n'))
+            # Evaluate submission
+            if st.button("🎯 Evaluate Submission", type="primary"):
+                if parallel_evaluation:
+                    scores_placeholder = st.empty()
+                    
+                    def show_early_scores(partial_result):
+                        with scores_placeholder.container():
+                            st.info("📊 Scores are in — generating detailed insights...")
+                            col1, col2, col3 = st.columns(3)
+                            with col1:
+                                st.metric("🎯 Total Score", f"{partial_result['total_score']}/60")
+                            with col2:
+                                st.metric("🏅 Grade", partial_result['grade'])
+                            with col3:
+                                st.metric("🚀 Pitch Readiness", f"{partial_result.get('pitch_readiness_score', 0)}/10")
+                    
+                    with st.spinner("🧠 AI is evaluating your submission..."):
+                        evaluation_result = evaluate_submission_parallel(extracted_text, on_scores=show_early_scores)
+                    # On failure the early scores stay visible next to the error explaining what is missing
+                    if evaluation_result:
+                        scores_placeholder.empty()
+                else:
+                    with st.spinner("🧠 AI is evaluating your submission..."):
+                        evaluation_result = evaluate_submission(extracted_text)
                 
-                st.success("✅ Content extracted successfully!")
+                st.session_state.evaluation_result = evaluation_result
+                st.session_state.report_future = None
+                if evaluation_result:
+                    start_report_rendering(evaluation_result, uploaded_file.name)
+            
+            evaluation_result = st.session_state.evaluation_result
+            if evaluation_result:
+                st.success("✅ Evaluation completed!")
+                display_evaluation_results(evaluation_result)
                 
-                # Display extraction stats
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("📝 Words", f"{word_count:,}")
-                with col2:
-                    st.metric("🔤 Characters", f"{char_count:,}")
-                with col3:
-                    st.metric("📄 Lines", f"{line_count:,}")
+                # PDF report is rendered speculatively in the background while the dashboard
+                # above is drawn, so it is normally ready by now; only wait a bounded time for it
+                st.header("📥 Export Report")
+                if st.session_state.report_future is None:
+                    start_report_rendering(evaluation_result, uploaded_file.name)
                 
-                # Show extracted text preview with better formatting
-                with st.expander("📄 Preview Extracted Content", expanded=False):
-                    if len(extracted_text) > 2000:
-                        st.info(f"Showing first 2000 characters of {len(extracted_text):,} total characters")
-                        preview_text = extracted_text[:2000] + "\n\n... [Content truncated for preview] ..."
-                    else:
-                        preview_text = extracted_text
-                    
-                    st.text_area(
-                        "Extracted Text", 
-                        preview_text, 
-                        height=300,
-                        help="This is the text content that will be sent to AI for evaluation"
+                try:
+                    with st.spinner("📄 Generating PDF report..."):
+                        pdf_data = st.session_state.report_future.result(timeout=REPORT_WAIT_SECONDS)
+                except FutureTimeoutError:
+                    st.info("📄 Your PDF report is still being prepared in the background...")
+                    st.button("🔄 Check Report Status")
+                except Exception as e:
+                    st.error(f"Error generating PDF report: {str(e)}")
+                    st.session_state.report_future = None
+                else:
+                    st.download_button(
+                        label="⬇️ Download PDF Report",
+                        data=pdf_data,
+                        file_name=f"evaluation_report_{uploaded_file.name.split('.')[0]}.pdf",
+                        mime="application/pdf"
                     )
-                
-                # Evaluate submission
-                if st.button("🎯 Evaluate Submission", type="primary"):
-                    with st.spinner("🧠 AI is evaluating your submission..."):
-                        evaluation_result = evaluate_submission(extracted_text)
-                    
-                    if evaluation_result:
-                        st.success("✅ Evaluation completed!")
-                        
-                        # Advanced Analysis Section
-                        st.header("🔍 Advanced Analysis")
-                        
-                        # Top row - Key insights
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("🎯 Theme/Domain", evaluation_result.get('theme', 'Not detected'))
-                        with col2:
-                            st.metric("🎯 Total Score", f"{evaluation_result['total_score']}/60")
-                        with col3:
-                            st.metric("🚀 Pitch Readiness", f"{evaluation_result.get('pitch_readiness_score', 0)}/10")
-                        
-                        # Project insights
-                        st.subheader("💡 Project Insights")
-                        col1, col2 = st.columns([1, 1])
-                        
-                        with col1:
-                            st.write("**🏷️ Suggested Project Title:**")
-                            st.info(evaluation_result.get('project_title', 'Title not generated'))
-                            
-                            st.write("**📝 Project Summary:**")
-                            st.write(evaluation_result.get('project_summary', 'Summary not available'))
-                        
-                        with col2:
-                            st.write("**🔑 Top Keywords:**")
-                            keywords = evaluation_result.get('keywords', [])
-                            if keywords:
-                                # Display keywords as tags
-                                keyword_html = " ".join([f"<span style='background-color: #e1f5fe; padding: 2px 8px; border-radius: 12px; margin: 2px; display: inline-block;'>{kw}</span>" for kw in keywords])
-                                st.markdown(keyword_html, unsafe_allow_html=True)
-                            else:
-                                st.write("No keywords detected")
-                        
-                        # Scores section
-                        st.header("📊 Detailed Evaluation Scores")
-                        col1, col2 = st.columns([2, 1])
-                        
-                        with col1:
-                            # Scores table
-                            scores_data = {
-                                "Criteria": ["Clarity", "Innovation", "Feasibility", "Presentation Quality", "Impact", "Theme Alignment"],
-                                "Score (out of 10)": [
-                                    evaluation_result['scores']['clarity'],
-                                    evaluation_result['scores']['innovation'],
-                                    evaluation_result['scores']['feasibility'],
-                                    evaluation_result['scores']['presentation'],
-                                    evaluation_result['scores']['impact'],
-                                    evaluation_result['scores']['theme_alignment']
-                                ]
-                            }
-                            
-                            st.dataframe(scores_data, use_container_width=True)
-                        
-                        with col2:
-                            # Grade with color coding
-                            grade = evaluation_result['grade']
-                            if grade in ['A+', 'A']:
-                                st.success(f"🏅 Grade: {grade}")
-                            elif grade == 'B':
-                                st.warning(f"🏅 Grade: {grade}")
-                            else:
-                                st.error(f"🏅 Grade: {grade}")
-                            
-                            # Visual quality assessment
-                            st.write("**🎨 Visual Quality:**")
-                            visual_comment = evaluation_result.get('visual_quality_comment', 'Not assessed')
-                            st.write(visual_comment)
-                        
-                        # Feedback and suggestions
-                        st.header("💬 Professional Feedback")
-                        st.info(evaluation_result['feedback_summary'])
-                        
-                        # Improvement suggestions and resources
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.subheader("🛠 Improvement Suggestions")
-                            for i, suggestion in enumerate(evaluation_result['improvement_suggestions'], 1):
-                                st.write(f"{i}. {suggestion}")
-                        
-                        with col2:
-                            st.subheader("📚 Recommended Resources")
-                            resources = evaluation_result.get('recommended_resources', [])
-                            for i, resource in enumerate(resources, 1):
-                                st.write(f"{i}. {resource}")
-                        
-                        # Generate PDF report
-                        st.header("📥 Export Report")
-                        if st.button("📄 Generate PDF Report"):
-                            with st.spinner("📄 Generating PDF report..."):
-                                pdf_data = generate_pdf_report(evaluation_result, uploaded_file.name)
-                                st.download_button(
-                                    label="⬇️ Download PDF Report",
-                                    data=pdf_data,
-                                    file_name=f"evaluation_report_{uploaded_file.name.split('.')[0]}.pdf",
-                                    mime="application/pdf"
-                                )
-        
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,294 @@
+"""
+Text extraction for PDF and PPTX submissions, run in sandboxed worker processes.
+
+Nothing in this module touches Streamlit: extractors raise on failure and report
+non-fatal problems through `warnings.warn`, which the worker relays back to the
+parent so the app can display them.
+"""
+
+import io
+import os
+import time
+import warnings
+import multiprocessing
+from multiprocessing import forkserver, popen_forkserver, reduction, spawn, util
+from multiprocessing.context import set_spawning_popen
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+import pypdf
+import pdfplumber
+from pptx import Presentation
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Sandboxed extraction limits (per uploaded file)
+EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_TIMEOUT_SECONDS", "60"))
+EXTRACTION_MAX_RSS_MB = int(os.getenv("EXTRACTION_MAX_RSS_MB", "1024"))
+EXTRACTION_FALLBACK_PAGES = int(os.getenv("EXTRACTION_FALLBACK_PAGES", "20"))
+EXTRACTION_FALLBACK_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_FALLBACK_TIMEOUT_SECONDS", "15"))
+
+MEMORY_LIMIT_REASON = "exceeded memory limit"
+
+def extract_text_from_pdf(file_path):
+    """Enhanced PDF text extraction using multiple methods for better coverage"""
+    text = ""
+    
+    # Method 1: Try pdfplumber first (better for complex layouts)
+    try:
+        with pdfplumber.open(file_path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    text += page_text + "\n"
+                
+                # Also extract text from tables if any
+                tables = page.extract_tables()
+                for table in tables:
+                    for row in table:
+                        if row:
+                            text += " | ".join([cell or "" for cell in row]) + "\n"
+        
+        if text.strip():
+            return text
+    except Exception as e:
+        warnings.warn(f"pdfplumber extraction failed: {str(e)}, trying pypdf...")
+    
+    # Method 2: Fallback to pypdf if pdfplumber fails
+    with open(file_path, 'rb') as file:
+        pdf_reader = pypdf.PdfReader(file)
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+    
+    return text if text.strip() else None
+
+def extract_text_from_pdf_pages(file_path, max_pages=EXTRACTION_FALLBACK_PAGES):
+    """Lightweight PDF fallback: pypdf only, first `max_pages` pages, no table parsing"""
+    text = ""
+    with open(file_path, 'rb') as file:
+        pdf_reader = pypdf.PdfReader(file)
+        for page in pdf_reader.pages[:max_pages]:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+    
+    return text if text.strip() else None
+
+def extract_text_from_pptx(file_path, max_slides=None):
+    """Enhanced PPTX text extraction including slide notes and comprehensive content"""
+    prs = Presentation(file_path)
+    text = ""
+    
+    for slide_num, slide in enumerate(prs.slides, 1):
+        if max_slides is not None and slide_num > max_slides:
+            break
+        text += f"\n--- Slide {slide_num} ---\n"
+        
+        # Extract text from all shapes
+        for shape in slide.shapes:
+            if hasattr(shape, "text") and shape.text.strip():
+                text += shape.text + "\n"
+            
+            # Extract text from tables
+            if shape.has_table:
+                table = shape.table
+                for row in table.rows:
+                    row_text = []
+                    for cell in row.cells:
+                        if cell.text.strip():
+                            row_text.append(cell.text.strip())
+                    if row_text:
+                        text += " | ".join(row_text) + "\n"
+            
+            # Extract text from text frames and paragraphs
+            if hasattr(shape, "text_frame"):
+                for paragraph in shape.text_frame.paragraphs:
+                    if paragraph.text.strip():
+                        text += paragraph.text + "\n"
+        
+        # Extract slide notes if available
+        if slide.has_notes_slide:
+            notes_slide = slide.notes_slide
+            if hasattr(notes_slide, 'notes_text_frame'):
+                notes_text = notes_slide.notes_text_frame.text
+                if notes_text.strip():
+                    text += f"[Slide Notes: {notes_text}]\n"
+    
+    return text.strip() if text.strip() else None
+
+def _limit_address_space(max_rss_mb):
+    """Hard cap in the worker: new allocations fail once resident memory would pass max_rss_mb"""
+    if resource is None:
+        return
+    try:
+        with open("/proc/self/statm") as f:
+            size_pages, rss_pages = (int(v) for v in f.read().split()[:2])
+        page_size = os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return
+    # Already-mapped but non-resident pages (shared libraries etc.) don't count against the budget
+    headroom = max(max_rss_mb * 1024 * 1024 - rss_pages * page_size, 0)
+    limit = size_pages * page_size + headroom
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+def _extraction_worker(extract_fn, file_path, args, max_rss_mb, conn):
+    """Worker process entry point: run the extractor and send back (status, payload, warnings)"""
+    _limit_address_space(max_rss_mb)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            result = ("ok", extract_fn(file_path, *args))
+        except MemoryError:
+            result = ("memory", f"allocation beyond {max_rss_mb} MB refused")
+        except BaseException as e:
+            result = ("error", f"{type(e).__name__}: {str(e)}")
+    try:
+        conn.send(result + ([str(w.message) for w in caught],))
+    finally:
+        conn.close()
+
+def _process_rss_mb(pid):
+    """Resident set size of a process in MB, or None where /proc is unavailable"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            rss_pages = int(f.read().split()[1])
+        return rss_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class _WorkerPopen(popen_forkserver.Popen):
+    """Forkserver launch that skips re-running the parent's __main__ in the child"""
+    def _launch(self, process_obj):
+        # Same as popen_forkserver.Popen._launch, minus the main-module fixup: the child would
+        # otherwise re-execute whatever __main__ is (the Streamlit app script or launcher) and
+        # re-import Streamlit before running the extractor
+        prep_data = spawn.get_preparation_data(process_obj._name)
+        prep_data.pop("init_main_from_path", None)
+        prep_data.pop("init_main_from_name", None)
+        buf = io.BytesIO()
+        set_spawning_popen(self)
+        try:
+            reduction.dump(prep_data, buf)
+            reduction.dump(process_obj, buf)
+        finally:
+            set_spawning_popen(None)
+        
+        self.sentinel, w = forkserver.connect_to_new_process(self._fds)
+        _parent_w = os.dup(w)
+        self.finalizer = util.Finalize(self, util.close_fds, (_parent_w, self.sentinel))
+        with open(w, 'wb', closefd=True) as f:
+            f.write(buf.getbuffer())
+        self.pid = forkserver.read_signed(self.sentinel)
+
+class _WorkerProcess(multiprocessing.context.ForkServerProcess):
+    @staticmethod
+    def _Popen(process_obj):
+        return _WorkerPopen(process_obj)
+
+def _sandbox_process(extract_fn):
+    """Process class for an extraction worker.
+    
+    Never fork the Streamlit server itself: it is heavily multi-threaded, and a child can
+    inherit locks held by other threads (logging, the Tornado loop, session queues) and
+    deadlock. A forkserver forks workers from a clean single-threaded helper with this
+    module preloaded, so extractors must be importable module-level functions. Only an
+    extractor defined in __main__ itself needs the usual main-module fixup.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn").Process
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["extraction"])
+    if extract_fn.__module__ == "__main__":
+        return ctx.Process
+    return _WorkerProcess
+
+def run_sandboxed_extraction(extract_fn, file_path, *args,
+                             timeout=EXTRACTION_TIMEOUT_SECONDS, max_rss_mb=EXTRACTION_MAX_RSS_MB):
+    """Run an extractor in an isolated worker process with a wall-clock timeout and RSS cap.
+    
+    Returns (text, failure_reason, notices). On timeout, memory overrun, crash, extractor
+    error or empty output, text is None and failure_reason describes why. notices are the
+    non-fatal warnings the extractor raised.
+    """
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    process = _sandbox_process(extract_fn)(
+        target=_extraction_worker,
+        args=(extract_fn, file_path, args, max_rss_mb, child_conn),
+        daemon=True
+    )
+    process.start()
+    child_conn.close()
+    
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            if parent_conn.poll(0.1):
+                try:
+                    status, payload, notices = parent_conn.recv()
+                except EOFError:
+                    return None, f"worker exited unexpectedly (exit code {process.exitcode})", []
+                if status == "memory":
+                    return None, f"{MEMORY_LIMIT_REASON} ({payload})", notices
+                if status != "ok":
+                    return None, f"failed ({payload})", notices
+                if not payload or not payload.strip():
+                    return None, "found no text", notices
+                return payload, None, notices
+            
+            if not process.is_alive():
+                return None, f"worker exited unexpectedly (exit code {process.exitcode})", []
+            
+            if time.monotonic() > deadline:
+                return None, f"timed out after {timeout:g}s", []
+            
+            # Backstop for platforms where the in-worker RLIMIT_AS cap is unavailable
+            rss_mb = _process_rss_mb(process.pid)
+            if rss_mb is not None and rss_mb > max_rss_mb:
+                return None, f"{MEMORY_LIMIT_REASON} ({rss_mb:.0f} MB > {max_rss_mb} MB)", []
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        parent_conn.close()
+
+def extract_submission_text(file_path, filename):
+    """Sandboxed extraction with a kill-and-fallback path.
+    
+    Returns (text, issues). issues is a list of messages for the user: extractor warnings,
+    and why the full extractor failed whenever the reduced fallback had to run. When text
+    is None, issues always explains why.
+    """
+    name = filename.lower()
+    if name.endswith('.pdf'):
+        text, reason, issues = run_sandboxed_extraction(extract_text_from_pdf, file_path)
+        fallback_fn, fallback_label = extract_text_from_pdf_pages, f"pypdf-only, first {EXTRACTION_FALLBACK_PAGES} pages"
+    elif name.endswith('.pptx'):
+        text, reason, issues = run_sandboxed_extraction(extract_text_from_pptx, file_path)
+        fallback_fn, fallback_label = extract_text_from_pptx, f"first {EXTRACTION_FALLBACK_PAGES} slides"
+    else:
+        return None, ["unsupported file type"]
+    
+    if reason is None:
+        return text, issues
+    
+    # python-pptx parses the whole package up front, so a PPTX that blew the memory cap
+    # would blow it again in the fallback; don't spend a second budget on it
+    if name.endswith('.pptx') and reason.startswith(MEMORY_LIMIT_REASON):
+        return None, issues + [f"Full extraction {reason}; fallback skipped"]
+    
+    # The fallback gets its own, shorter budget so worst-case latency stays bounded
+    fallback_text, fallback_reason, fallback_issues = run_sandboxed_extraction(
+        fallback_fn, file_path, EXTRACTION_FALLBACK_PAGES, timeout=EXTRACTION_FALLBACK_TIMEOUT_SECONDS
+    )
+    issues = issues + fallback_issues
+    if fallback_reason is None:
+        return fallback_text, issues + [f"Full extraction {reason}; used fallback ({fallback_label})"]
+    return None, issues + [f"Full extraction {reason}; fallback ({fallback_label}) {fallback_reason}"]
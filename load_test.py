@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test for the submission evaluator against a local stub LLM server.
+
+Runs the full pipeline (upload bytes -> extraction -> evaluate_submission ->
+generate_pdf_report) for N simulated concurrent users. LLM calls go to a local
+Groq-compatible stub with configurable latency, error rate and output length,
+so no network or API key is needed.
+
+Usage:
+    python load_test.py --users 8 --iterations 5 --latency-ms 300 --ms-per-token 5
+    python load_test.py --stub-only --port 8765   # just serve the stub
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet
+from pptx import Presentation
+
+STAGES = ["upload", "extraction", "evaluation", "report", "total"]
+
+SAMPLE_TITLE = "Smart City Traffic Management"
+SAMPLE_SECTIONS = [
+    ("Problem Statement", "Urban traffic congestion costs commuters hours every week. Current signal systems are reactive rather than predictive."),
+    ("Proposed Solution", "An AI-powered platform that uses IoT sensors, cameras and mobile data to predict traffic and optimise signal timing."),
+    ("Key Features", "Real-time traffic prediction, dynamic signal optimisation, a commuter route app and public transport integration."),
+    ("Impact", "Shorter commutes, lower emissions and better use of existing road infrastructure.")
+]
+
+STUB_RESULT = {
+    "scores": {
+        "clarity": 8,
+        "innovation": 7,
+        "feasibility": 7,
+        "presentation": 8,
+        "impact": 7,
+        "theme_alignment": 8
+    },
+    "total_score": 45,
+    "grade": "A",
+    "feedback_summary": "Clear problem statement and a credible solution.",
+    "theme": "Smart Cities",
+    "keywords": ["traffic", "AI", "IoT", "sensors", "mobility"],
+    "project_title": "Predictive Traffic Flow for Smart Cities",
+    "project_summary": "AI-driven signal timing using live sensor data. Cuts congestion and emissions.",
+    "improvement_suggestions": [
+        "Add pilot deployment metrics",
+        "Detail the data privacy approach",
+        "Include a cost breakdown per intersection"
+    ],
+    "recommended_resources": ["SUMO traffic simulator", "Business Model Canvas"],
+    "visual_quality_comment": "Well structured with clear headings.",
+    "pitch_readiness_score": 7
+}
+
+class StubGroqHandler(BaseHTTPRequestHandler):
+    """Minimal Groq/OpenAI-compatible /chat/completions endpoint"""
+    config = {"latency_ms": 200, "ms_per_token": 0, "error_rate": 0.0, "output_tokens": 300}
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+
+        request = json.loads(body or b"{}")
+        completion_tokens = min(self.config["output_tokens"], request.get("max_tokens") or self.config["output_tokens"])
+
+        # Simulate time-to-first-token plus linear decode time
+        time.sleep((self.config["latency_ms"] + completion_tokens * self.config["ms_per_token"]) / 1000)
+
+        if random.random() < self.config["error_rate"]:
+            self._send_json(500, {"error": {"message": "stub injected failure", "type": "server_error"}})
+            return
+
+        result = dict(STUB_RESULT)
+        base_tokens = len(json.dumps(result).split())
+        filler = " ".join(["detail"] * max(0, completion_tokens - base_tokens))
+        result["feedback_summary"] = f"{result['feedback_summary']} {filler}".strip()
+
+        prompt_tokens = sum(len(m.get("content", "").split()) for m in request.get("messages", []))
+        self._send_json(200, {
+            "id": f"stub-{random.getrandbits(32):08x}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "logprobs": {"content": None},
+                "message": {"role": "assistant", "content": json.dumps(result)}
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server(port=0, **config):
+    """Start the stub in a background thread; returns (server, base_url)"""
+    handler = type("ConfiguredStubGroqHandler", (StubGroqHandler,), {"config": {**StubGroqHandler.config, **config}})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def create_sample_submission(kind):
+    """Build sample upload bytes for the given file type"""
+    buffer = io.BytesIO()
+    if kind == "pdf":
+        styles = getSampleStyleSheet()
+        story = [Paragraph(SAMPLE_TITLE, styles['Title']), Spacer(1, 12)]
+        for heading, body in SAMPLE_SECTIONS:
+            story += [Paragraph(heading, styles['Heading2']), Paragraph(body, styles['Normal']), Spacer(1, 12)]
+        SimpleDocTemplate(buffer, pagesize=letter).build(story)
+    else:
+        prs = Presentation()
+        prs.slides.add_slide(prs.slide_layouts[0]).shapes.title.text = SAMPLE_TITLE
+        for heading, body in SAMPLE_SECTIONS:
+            slide = prs.slides.add_slide(prs.slide_layouts[1])
+            slide.shapes.title.text = heading
+            slide.shapes.placeholders[1].text = body
+        prs.save(buffer)
+    return buffer.getvalue()
+
+def run_pipeline(upload_bytes, filename, parallel_evaluation=False):
+    """One simulated user request through the full pipeline; returns per-stage seconds"""
+    from app import extract_submission_text, evaluate_submission, evaluate_submission_parallel, generate_pdf_report
+    timings = {}
+    start = time.perf_counter()
+
+    t0 = time.perf_counter()
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{filename.split('.')[-1]}") as tmp_file:
+        tmp_file.write(upload_bytes)
+        tmp_file_path = tmp_file.name
+    timings["upload"] = time.perf_counter() - t0
+
+    try:
+        t0 = time.perf_counter()
+        extracted_text, extraction_issues = extract_submission_text(tmp_file_path, filename)
+        timings["extraction"] = time.perf_counter() - t0
+        if not extracted_text:
+            raise RuntimeError(f"extraction failed: {'; '.join(extraction_issues)}")
+
+        t0 = time.perf_counter()
+        if parallel_evaluation:
+            evaluation_result = evaluate_submission_parallel(extracted_text)
+        else:
+            evaluation_result = evaluate_submission(extracted_text)
+        timings["evaluation"] = time.perf_counter() - t0
+        if not evaluation_result:
+            raise RuntimeError("evaluation failed")
+
+        t0 = time.perf_counter()
+        generate_pdf_report(evaluation_result, filename)
+        timings["report"] = time.perf_counter() - t0
+    finally:
+        os.unlink(tmp_file_path)
+
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+def percentile(values, pct):
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def run_load_test(users, iterations, kind="pdf", parallel_evaluation=False):
+    """Simulate `users` concurrent users each running `iterations` pipelines"""
+    filename = f"load_test_submission.{kind}"
+    upload_bytes = create_sample_submission(kind)
+    stage_timings = {stage: [] for stage in STAGES}
+    errors = []
+    lock = threading.Lock()
+
+    def user_session(user_id):
+        for _ in range(iterations):
+            try:
+                timings = run_pipeline(upload_bytes, filename, parallel_evaluation)
+            except Exception as e:
+                with lock:
+                    errors.append(f"user {user_id}: {str(e)}")
+                continue
+            with lock:
+                for stage, seconds in timings.items():
+                    stage_timings[stage].append(seconds)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        list(executor.map(user_session, range(users)))
+    wall_time = time.perf_counter() - start
+
+    completed = len(stage_timings["total"])
+    return {
+        "users": users,
+        "requests": users * iterations,
+        "completed": completed,
+        "errors": errors,
+        "wall_time": wall_time,
+        "throughput": completed / wall_time if wall_time else 0.0,
+        "stages": {
+            stage: {f"p{p}": percentile(values, p) * 1000 for p in (50, 95, 99)}
+            for stage, values in stage_timings.items()
+        }
+    }
+
+def print_report(report):
+    print(f"\n📊 Load test: {report['users']} concurrent users, {report['requests']} pipelines")
+    print(f"   ✅ Completed: {report['completed']}   ❌ Failed: {len(report['errors'])}")
+    print(f"   ⏱️  Wall time: {report['wall_time']:.2f}s   🚀 Throughput: {report['throughput']:.2f} pipelines/s\n")
+    print(f"   {'Stage':<12}{'p50 (ms)':>12}{'p95 (ms)':>12}{'p99 (ms)':>12}")
+    for stage, stats in report["stages"].items():
+        print(f"   {stage:<12}{stats['p50']:>12.1f}{stats['p95']:>12.1f}{stats['p99']:>12.1f}")
+    for error in report["errors"][:5]:
+        print(f"   ⚠️  {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the submission evaluator against a local stub LLM")
+    parser.add_argument("--users", type=int, default=4, help="Concurrent simulated users")
+    parser.add_argument("--iterations", type=int, default=3, help="Pipelines per user")
+    parser.add_argument("--file-type", choices=["pdf", "pptx"], default="pdf")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Stub time to first token")
+    parser.add_argument("--ms-per-token", type=float, default=0, help="Stub decode time per output token")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub calls that return HTTP 500")
+    parser.add_argument("--output-tokens", type=int, default=300, help="Stub completion length (capped by max_tokens)")
+    parser.add_argument("--parallel-evaluation", action="store_true", help="Use concurrent scores/insights sub-requests")
+    parser.add_argument("--max-retries", type=int, default=0,
+                        help="Groq client retries per call (0 so injected errors show up as failures)")
+    parser.add_argument("--port", type=int, default=0, help="Stub port (0 = pick a free port)")
+    parser.add_argument("--stub-only", action="store_true", help="Only run the stub server")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        ms_per_token=args.ms_per_token,
+        error_rate=args.error_rate,
+        output_tokens=args.output_tokens
+    )
+    print(f"🧪 Stub LLM server listening on {base_url}")
+
+    if args.stub_only:
+        print(f"   Point the app at it with GROQ_BASE_URL={base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+        return
+
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ["GROQ_API_KEY"] = "stub-key"
+    os.environ["GROQ_MAX_RETRIES"] = str(args.max_retries)
+    try:
+        print_report(run_load_test(args.users, args.iterations, args.file_type, args.parallel_evaluation))
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
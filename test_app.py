@@ -4,7 +4,9 @@ Simple test script to verify the submission evaluator components work correctly
 """
 
 import os
+import time
 import tempfile
+from contextlib import contextmanager
 from app import extract_text_from_pdf, extract_text_from_pptx
 
 def test_pdf_extraction():
@@ -40,6 +42,57 @@ def test_imports():
         print(f"❌ Import error: {e}")
         return False
 
+@contextmanager
+def stub_llm_environment(**config):
+    """Run a local stub LLM server and point the Groq client at it for the duration"""
+    from load_test import start_stub_server
+    server, base_url = start_stub_server(**config)
+    previous = {key: os.environ.get(key) for key in ("GROQ_BASE_URL", "GROQ_API_KEY")}
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ["GROQ_API_KEY"] = "stub-key"
+    try:
+        yield base_url
+    finally:
+        server.shutdown()
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+def test_load_harness_with_stub():
+    """Run the end-to-end load harness against the local stub LLM server"""
+    print("Testing load harness...")
+    from load_test import run_load_test
+    with stub_llm_environment(latency_ms=10):
+        report = run_load_test(users=2, iterations=1)
+    assert report["completed"] == 2, report["errors"]
+    assert report["stages"]["evaluation"]["p50"] >= 10
+    print(f"✅ Load harness completed {report['completed']} pipelines")
+    return True
+
+def test_parallel_evaluation_with_stub():
+    """Decomposed evaluation returns the full result and reports scores before insights finish"""
+    print("Testing parallel evaluation...")
+    from app import evaluate_submission_parallel, build_evaluation_result
+    early_scores = []
+    # Stub decode time: ~160 ms for the 150-token scores call, ~610 ms for the 600-token insights call
+    with stub_llm_environment(latency_ms=10, ms_per_token=1, output_tokens=600):
+        start = time.perf_counter()
+        result = evaluate_submission_parallel(
+            "Smart traffic pitch",
+            on_scores=lambda partial: early_scores.append((time.perf_counter() - start, partial))
+        )
+        finished = time.perf_counter() - start
+    assert result is not None and set(result) == set(build_evaluation_result({}))
+    assert result["theme"] == "Smart Cities" and result["total_score"] == 45
+    assert len(early_scores) == 1 and early_scores[0][1]["total_score"] == 45
+    # Insights can only have finished by the time the call returns; scores must land well before
+    scores_at = early_scores[0][0]
+    assert scores_at + 0.3 < finished, (scores_at, finished)
+    print(f"✅ Parallel evaluation merged scores and insights (scores at {scores_at:.2f}s, done at {finished:.2f}s)")
+    return True
+
 if __name__ == "__main__":
     print("🧪 Testing Submission Evaluator Components\n")
     
@@ -47,7 +100,9 @@ if __name__ == "__main__":
     tests = [
         test_imports,
         test_pdf_extraction,
-        test_pptx_extraction
+        test_pptx_extraction,
+        test_load_harness_with_stub,
+        test_parallel_evaluation_with_stub
     ]
     
     passed = 0
@@ -3,8 +3,10 @@
 Test script to demonstrate the enhanced text extraction capabilities
 """
 
+import os
 import tempfile
-from app import extract_text_from_pdf, extract_text_from_pptx
+import time
+from extraction import extract_text_from_pdf, extract_text_from_pptx, run_sandboxed_extraction, extract_submission_text
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
@@ -118,7 +120,6 @@ def test_enhanced_extraction():
         print(f"❌ PPTX extraction error: {e}")
     
     # Cleanup
-    import os
     try:
         os.unlink(pdf_file)
         os.unlink(pptx_file)
@@ -131,5 +132,50 @@ def test_enhanced_extraction():
     print("   • PPTX: Slide content, tables, and speaker notes")
     print("   • Better handling of formatting and structure")
 
+def _slow_extractor(file_path):
+    """Simulates a pathological file that pins the CPU"""
+    time.sleep(30)
+    return "never returned"
+
+def _memory_hog_extractor(file_path):
+    """Simulates a decompression bomb that balloons memory"""
+    blocks = []
+    while True:
+        blocks.append(bytearray(16 * 1024 * 1024))
+
+def test_sandboxed_extraction():
+    """Test that extraction workers are killed on timeout / memory overrun and that normal files still extract"""
+    print("🛡️ Testing Sandboxed Extraction...")
+    
+    start = time.monotonic()
+    text, reason, _ = run_sandboxed_extraction(_slow_extractor, "unused.pdf", timeout=1)
+    assert text is None and "timed out" in reason
+    assert time.monotonic() - start < 10
+    print(f"   ✅ Slow worker killed: {reason}")
+    
+    text, reason, _ = run_sandboxed_extraction(_memory_hog_extractor, "unused.pdf", timeout=30, max_rss_mb=256)
+    assert text is None and "memory limit" in reason
+    print(f"   ✅ Memory hog killed: {reason}")
+    
+    pdf_file = create_test_pdf()
+    try:
+        text, issues = extract_submission_text(pdf_file, "submission.pdf")
+        assert issues == [] and "Traffic" in text
+        print("   ✅ Normal PDF extracted in sandbox")
+    finally:
+        os.unlink(pdf_file)
+    
+    # Unparseable files must come back with a reason, never silently empty
+    for suffix in (".pdf", ".pptx"):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as bad_file:
+            bad_file.write(b"this is not a real document")
+        try:
+            text, issues = extract_submission_text(bad_file.name, f"bad{suffix}")
+            assert text is None and issues and "fallback" in issues[-1]
+            print(f"   ✅ Garbage {suffix} reported: {issues[-1]}")
+        finally:
+            os.unlink(bad_file.name)
+
 if __name__ == "__main__":
-    test_enhanced_extraction()
\ No newline at end of file
+    test_enhanced_extraction()
+    test_sandboxed_extraction()
\ No newline at end of file